@@ -48,6 +48,11 @@ class BaseGASampler(BaseSampler, abc.ABC):
 
     def __init__(self, population_size: int | None):
         self._population_size = population_size
+        # Cache of the generation number of each trial, keyed by trial ID.
+        self._trial_generation_cache: dict[int, int] = {}
+        # Incremental scan state per study ID: the IDs of the completed trials counted so far,
+        # the maximum generation number among them, and the number of trials at that generation.
+        self._generation_scans: dict[int, tuple[set[int], int, int]] = {}
 
     @property
     def population_size(self) -> int | None:
@@ -102,21 +107,39 @@ class BaseGASampler(BaseSampler, abc.ABC):
         if generation is not None:
             return generation
 
-        trials = study._get_trials(deepcopy=False, states=[TrialState.COMPLETE], use_cache=True)
+        generation = self._trial_generation_cache.get(trial._trial_id)
+        if generation is not None:
+            return generation
 
-        max_generation, max_generation_count = 0, 0
+        trials = study._get_trials(deepcopy=False, states=[TrialState.COMPLETE], use_cache=True)
 
-        for t in reversed(trials):
-            generation = t.system_attrs.get(self._get_generation_key(), -1)
+        # The generation number of a completed trial never changes, so only trials that have
+        # not been counted yet are scanned. The generation numbers are not ordered by trial
+        # number, hence the maximum and its count can be updated incrementally regardless of
+        # the order in which trials complete.
+        seen_trial_ids, max_generation, max_generation_count = self._generation_scans.get(
+            study._study_id, (set(), 0, 0)
+        )
+        for t in trials:
+            if t._trial_id in seen_trial_ids:
+                continue
+            seen_trial_ids.add(t._trial_id)
+            t_generation = t.system_attrs.get(self._get_generation_key(), -1)
 
-            if generation < max_generation:
+            if t_generation < max_generation:
                 continue
-            elif generation > max_generation:
-                max_generation = generation
+            elif t_generation > max_generation:
+                max_generation = t_generation
                 max_generation_count = 1
             else:
                 max_generation_count += 1
 
+        self._generation_scans[study._study_id] = (
+            seen_trial_ids,
+            max_generation,
+            max_generation_count,
+        )
+
         assert self._population_size is not None, "Population size must be set."
         if max_generation_count < self._population_size:
             generation = max_generation
@@ -125,6 +148,7 @@ class BaseGASampler(BaseSampler, abc.ABC):
         study._storage.set_trial_system_attr(
             trial._trial_id, self._get_generation_key(), generation
         )
+        self._trial_generation_cache[trial._trial_id] = generation
         return generation
 
     def get_population(self, study: optuna.Study, generation: int) -> list[FrozenTrial]:
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 from optuna.distributions import BaseDistribution
 from optuna.samplers._lazy_random_state import LazyRandomState
 from optuna.samplers.nsgaii._constraints_evaluation import _constrained_dominates
+from optuna.samplers.nsgaii._crossover import _ParentPopulationParams
 from optuna.samplers.nsgaii._crossover import perform_crossover
 from optuna.samplers.nsgaii._crossovers._base import BaseCrossover
 from optuna.study._multi_objective import _dominates
@@ -53,6 +54,7 @@ class NSGAIIChildGenerationStrategy:
         self._crossover = crossover
         self._constraints_func = constraints_func
         self._rng = rng
+        self._population_params_cache: dict[Any, _ParentPopulationParams] = {}
 
     def __call__(
         self,
@@ -72,20 +74,24 @@ class NSGAIIChildGenerationStrategy:
             A dictionary containing the parameter names and parameter's values.
         """
         dominates = _dominates if self._constraints_func is None else _constrained_dominates
+        # The `rng` property of `LazyRandomState` checks for initialization on every access,
+        # so the generator is bound to a local once and reused in the loops below.
+        rng = self._rng.rng
         # We choose a child based on the specified crossover method.
-        if self._rng.rng.rand() < self._crossover_prob:
+        if rng.rand() < self._crossover_prob:
             child_params = perform_crossover(
                 self._crossover,
                 study,
                 parent_population,
                 search_space,
-                self._rng.rng,
+                rng,
                 self._swapping_prob,
                 dominates,
+                population_params_cache=self._population_params_cache,
             )
         else:
             parent_population_size = len(parent_population)
-            parent_params = parent_population[self._rng.rng.choice(parent_population_size)].params
+            parent_params = parent_population[rng.choice(parent_population_size)].params
             child_params = {name: parent_params[name] for name in search_space.keys()}
 
         n_params = len(child_params)
@@ -96,6 +102,6 @@ class NSGAIIChildGenerationStrategy:
 
         params = {}
         for param_name in child_params.keys():
-            if self._rng.rng.rand() >= mutation_prob:
+            if rng.rand() >= mutation_prob:
                 params[param_name] = child_params[param_name]
         return params
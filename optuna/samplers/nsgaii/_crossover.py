@@ -26,26 +26,84 @@ _NUMERICAL_DISTRIBUTIONS = (
 )
 
 
+class _ParentPopulationParams:
+    """Structure-of-arrays view of the parent population parameters.
+
+    The parent population is fixed within a generation, so an instance can be built once and
+    reused for every child generated from the same population. Crossovers then gather parent
+    rows from the pre-transformed matrices instead of re-reading ``parent.params`` dicts.
+    """
+
+    def __init__(
+        self,
+        parent_population: Sequence[FrozenTrial],
+        search_space: dict[str, BaseDistribution],
+    ) -> None:
+        numerical_search_space: dict[str, BaseDistribution] = {}
+        categorical_search_space: dict[str, BaseDistribution] = {}
+        for key, value in search_space.items():
+            if isinstance(value, _NUMERICAL_DISTRIBUTIONS):
+                numerical_search_space[key] = value
+            else:
+                categorical_search_space[key] = value
+
+        self.numerical_search_space = numerical_search_space
+        self.categorical_search_space = categorical_search_space
+
+        self.numerical_transform: _SearchSpaceTransform | None = None
+        if len(numerical_search_space) != 0:
+            self.numerical_transform = _SearchSpaceTransform(numerical_search_space)
+
+        self.categorical_params: np.ndarray | None = None
+        if len(categorical_search_space) > 0:
+            self.categorical_params = np.array(
+                [
+                    [parent.params[p] for p in categorical_search_space]
+                    for parent in parent_population
+                ],
+                dtype=object,
+            )
+
+        # Partially evaluated containment checks for the fixed search space: binding the
+        # conversion and containment methods once removes the per-parameter dict lookup and
+        # attribute dispatch from every crossover attempt.
+        self.containment_checks: list[
+            tuple[str, Callable[[Any], float], Callable[[float], bool]]
+        ] = [
+            (name, distribution.to_internal_repr, distribution._contains)
+            for name, distribution in search_space.items()
+        ]
+
+        self.numerical_params: np.ndarray | None = None
+        if self.numerical_transform is not None:
+            self.numerical_params = np.stack(
+                [
+                    self.numerical_transform.transform(
+                        {
+                            param_key: parent.params[param_key]
+                            for param_key in numerical_search_space.keys()
+                        }
+                    )
+                    for parent in parent_population
+                ]
+            )  # Parent individuals with NUMERICAL_DISTRIBUTIONS parameters.
+
+
 def _try_crossover(
-    parents: list[FrozenTrial],
+    parent_indices: list[int],
     crossover: BaseCrossover,
     study: Study,
     rng: np.random.RandomState,
     swapping_prob: float,
-    categorical_search_space: dict[str, BaseDistribution],
-    numerical_search_space: dict[str, BaseDistribution],
-    numerical_transform: _SearchSpaceTransform | None,
+    population_params: _ParentPopulationParams,
 ) -> dict[str, Any]:
     child_params: dict[str, Any] = {}
 
-    if len(categorical_search_space) > 0:
-        parents_categorical_params = np.array(
-            [
-                [parent.params[p] for p in categorical_search_space]
-                for parent in [parents[0], parents[-1]]
-            ],
-            dtype=object,
-        )
+    if population_params.categorical_params is not None:
+        categorical_search_space = population_params.categorical_search_space
+        parents_categorical_params = population_params.categorical_params[
+            [parent_indices[0], parent_indices[-1]]
+        ]
 
         child_categorical_array = _inlined_categorical_uniform_crossover(
             parents_categorical_params, rng, swapping_prob, categorical_search_space
@@ -55,21 +113,13 @@ def _try_crossover(
         }
         child_params.update(child_categorical_params)
 
+    numerical_transform = population_params.numerical_transform
     if numerical_transform is None:
         return child_params
 
     # The following is applied only for numerical parameters.
-    parents_numerical_params = np.stack(
-        [
-            numerical_transform.transform(
-                {
-                    param_key: parent.params[param_key]
-                    for param_key in numerical_search_space.keys()
-                }
-            )
-            for parent in parents
-        ]
-    )  # Parent individual with NUMERICAL_DISTRIBUTIONS parameter.
+    assert population_params.numerical_params is not None
+    parents_numerical_params = population_params.numerical_params[parent_indices]
 
     child_numerical_array = crossover.crossover(
         parents_numerical_params, rng, study, numerical_transform.bounds
@@ -88,33 +138,38 @@ def perform_crossover(
     rng: np.random.RandomState,
     swapping_prob: float,
     dominates: Callable[[FrozenTrial, FrozenTrial, Sequence[StudyDirection]], bool],
+    population_params_cache: dict[Any, _ParentPopulationParams] | None = None,
 ) -> dict[str, Any]:
-    numerical_search_space: dict[str, BaseDistribution] = {}
-    categorical_search_space: dict[str, BaseDistribution] = {}
-    for key, value in search_space.items():
-        if isinstance(value, _NUMERICAL_DISTRIBUTIONS):
-            numerical_search_space[key] = value
-        else:
-            categorical_search_space[key] = value
-
-    numerical_transform: _SearchSpaceTransform | None = None
-    if len(numerical_search_space) != 0:
-        numerical_transform = _SearchSpaceTransform(numerical_search_space)
+    # The parameter matrices only depend on the parent population and the search space, which
+    # are fixed within a generation. Since the intersection search space keeps a parameter only
+    # if its distribution is identical in all trials, identical key sets imply identical
+    # distributions, so the parameter names suffice as part of the cache key.
+    cache_key = (
+        tuple(trial._trial_id for trial in parent_population),
+        tuple(search_space),
+    )
+    population_params = (
+        None if population_params_cache is None else population_params_cache.get(cache_key)
+    )
+    if population_params is None:
+        population_params = _ParentPopulationParams(parent_population, search_space)
+        if population_params_cache is not None:
+            # Stale generations are never requested again, so one entry is enough.
+            population_params_cache.clear()
+            population_params_cache[cache_key] = population_params
 
     while True:  # Repeat while parameters lie outside search space boundaries.
-        parents = _select_parents(crossover, study, parent_population, rng, dominates)
+        parent_indices = _select_parents(crossover, study, parent_population, rng, dominates)
         child_params = _try_crossover(
-            parents,
+            parent_indices,
             crossover,
             study,
             rng,
             swapping_prob,
-            categorical_search_space,
-            numerical_search_space,
-            numerical_transform,
+            population_params,
         )
 
-        if _is_contained(child_params, search_space):
+        if _is_contained_fast(child_params, population_params.containment_checks):
             break
 
     return child_params
@@ -126,13 +181,13 @@ def _select_parents(
     parent_population: Sequence[FrozenTrial],
     rng: np.random.RandomState,
     dominates: Callable[[FrozenTrial, FrozenTrial, Sequence[StudyDirection]], bool],
-) -> list[FrozenTrial]:
-    parents: list[FrozenTrial] = []
+) -> list[int]:
+    parents: list[int] = []
+    candidates = list(range(len(parent_population)))
     for _ in range(crossover.n_parents):
-        parent = _select_parent(
-            study, [t for t in parent_population if t not in parents], rng, dominates
-        )
-        parents.append(parent)
+        parent_index = _select_parent(study, parent_population, candidates, rng, dominates)
+        candidates.remove(parent_index)
+        parents.append(parent_index)
 
     return parents
 
@@ -140,15 +195,16 @@ def _select_parents(
 def _select_parent(
     study: Study,
     parent_population: Sequence[FrozenTrial],
+    candidates: Sequence[int],
     rng: np.random.RandomState,
     dominates: Callable[[FrozenTrial, FrozenTrial, Sequence[StudyDirection]], bool],
-) -> FrozenTrial:
-    population_size = len(parent_population)
-    candidate0 = parent_population[rng.choice(population_size)]
-    candidate1 = parent_population[rng.choice(population_size)]
+) -> int:
+    n_candidates = len(candidates)
+    candidate0 = candidates[rng.choice(n_candidates)]
+    candidate1 = candidates[rng.choice(n_candidates)]
 
     # TODO(ohta): Consider crowding distance.
-    if dominates(candidate0, candidate1, study.directions):
+    if dominates(parent_population[candidate0], parent_population[candidate1], study.directions):
         return candidate0
     else:
         return candidate1
@@ -163,6 +219,18 @@ def _is_contained(params: dict[str, Any], search_space: dict[str, BaseDistributi
     return True
 
 
+def _is_contained_fast(
+    params: dict[str, Any],
+    containment_checks: list[tuple[str, Callable[[Any], float], Callable[[float], bool]]],
+) -> bool:
+    # Equivalent to `_is_contained` with the distribution methods pre-bound
+    # in `_ParentPopulationParams`.
+    for param_name, to_internal_repr, contains in containment_checks:
+        if param_name in params and not contains(to_internal_repr(params[param_name])):
+            return False
+    return True
+
+
 def _inlined_categorical_uniform_crossover(
     parent_params: np.ndarray,
     rng: np.random.RandomState,
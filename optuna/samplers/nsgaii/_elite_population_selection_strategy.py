@@ -44,8 +44,13 @@ class NSGAIIElitePopulationSelectionStrategy:
             A list of trials that are selected as elite population.
         """
         _validate_constraints(population, is_constrained=self._constraints_func is not None)
+        # Trials not in the best `population_size` ranks are never selected, so the
+        # non-domination rank computation may terminate early once that many trials are ranked.
         population_per_rank = _rank_population(
-            population, study.directions, is_constrained=self._constraints_func is not None
+            population,
+            study.directions,
+            is_constrained=self._constraints_func is not None,
+            n_below=self._population_size,
         )
         elite_population: list[FrozenTrial] = []
         for individuals in population_per_rank:
@@ -77,34 +82,48 @@ def _calc_crowding_distance(population: list[FrozenTrial]) -> defaultdict[int, f
     """
 
     manhattan_distances: defaultdict[int, float] = defaultdict(float)
-    if len(population) == 0:
+    n_trials = len(population)
+    if n_trials == 0:
         return manhattan_distances
 
-    for i in range(len(population[0].values)):
-        population.sort(key=lambda x: x.values[i])
+    objective_values = np.asarray([trial.values for trial in population], dtype=np.float64)
+    distances = np.zeros(n_trials, dtype=np.float64)
+    order = np.arange(n_trials)
+    for i in range(objective_values.shape[1]):
+        # The stable sort applied to the previous order reproduces the tie-breaking behavior of
+        # sorting the population dimension by dimension.
+        order = order[np.argsort(objective_values[order, i], kind="stable")]
+        vs = np.empty(n_trials + 2, dtype=np.float64)
+        vs[0] = -np.inf
+        vs[1:-1] = objective_values[order, i]
+        vs[-1] = np.inf
 
         # If all trials in population have the same value in the i-th dimension, ignore the
         # objective dimension since it does not make difference.
-        if population[0].values[i] == population[-1].values[i]:
+        if vs[1] == vs[-2]:
             continue
 
-        vs = [-float("inf")] + [trial.values[i] for trial in population] + [float("inf")]
-
-        # Smallest finite value.
-        v_min = next(x for x in vs if x != -float("inf"))
+        # Smallest value other than -inf.
+        v_min = vs[vs != -np.inf].min()
 
-        # Largest finite value.
-        v_max = next(x for x in reversed(vs) if x != float("inf"))
+        # Largest value other than inf.
+        v_max = vs[vs != np.inf].max()
 
         width = v_max - v_min
         if width <= 0:
             # width == 0 or width == -inf
             width = 1.0
 
-        for j in range(len(population)):
-            # inf - inf and (-inf) - (-inf) is considered to be zero.
-            gap = 0.0 if vs[j] == vs[j + 2] else vs[j + 2] - vs[j]
-            manhattan_distances[population[j].number] += gap / width
+        # inf - inf and (-inf) - (-inf) is considered to be zero.
+        gaps = np.zeros(n_trials, dtype=np.float64)
+        np.subtract(vs[2:], vs[:-2], out=gaps, where=vs[2:] != vs[:-2])
+        distances[order] += gaps / width
+
+    # Reorder the population as the dimension-by-dimension sorting did so that downstream sorts
+    # break ties in the same way.
+    population[:] = [population[i] for i in order]
+    for i, trial in zip(order, population):
+        manhattan_distances[trial.number] = distances[i]
     return manhattan_distances
 
 
@@ -119,6 +138,7 @@ def _rank_population(
     directions: Sequence[StudyDirection],
     *,
     is_constrained: bool = False,
+    n_below: int | None = None,
 ) -> list[list[FrozenTrial]]:
     if len(population) == 0:
         return []
@@ -129,7 +149,15 @@ def _rank_population(
     )
     penalty = _evaluate_penalty(population) if is_constrained else None
 
-    domination_ranks = _fast_non_domination_rank(objective_values, penalty=penalty)
+    # The import below is deferred so that importing this module does not require numba.
+    from optuna.samplers.nsgaii import _nds_numba
+
+    if penalty is None and _nds_numba._is_available() and not np.isnan(objective_values).any():
+        domination_ranks = _nds_numba._non_domination_rank(objective_values, n_below=n_below)
+    else:
+        domination_ranks = _fast_non_domination_rank(
+            objective_values, penalty=penalty, n_below=n_below
+        )
     population_per_rank: list[list[FrozenTrial]] = [[] for _ in range(max(domination_ranks) + 1)]
     for trial, rank in zip(population, domination_ranks):
         if rank == -1:
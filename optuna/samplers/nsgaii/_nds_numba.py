@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import numpy as np
+
+from optuna._imports import try_import
+
+
+with try_import() as _imports:
+    import numba
+
+
+def _is_available() -> bool:
+    return _imports.is_successful()
+
+
+def _non_domination_rank_kernel(loss_values: np.ndarray, n_below: int) -> np.ndarray:
+    # NOTE: This function is compiled by Numba when it is available. It must therefore stay
+    # restricted to scalar loops and NumPy constructs supported in nopython mode.
+    # Compared to the vectorized implementation in `optuna.study._multi_objective`, the pairwise
+    # dominance loop below exits early once neither trial can dominate the other and does not
+    # materialize intermediate arrays per front.
+    (n_trials, n_objectives) = loss_values.shape
+    dominates = np.zeros((n_trials, n_trials), dtype=np.bool_)
+    n_dominators = np.zeros(n_trials, dtype=np.int64)
+    for p in range(n_trials):
+        for q in range(p + 1, n_trials):
+            p_leq_q = True
+            q_leq_p = True
+            for k in range(n_objectives):
+                if loss_values[p, k] < loss_values[q, k]:
+                    q_leq_p = False
+                elif loss_values[q, k] < loss_values[p, k]:
+                    p_leq_q = False
+                if not p_leq_q and not q_leq_p:
+                    break
+            if p_leq_q and not q_leq_p:
+                dominates[p, q] = True
+                n_dominators[q] += 1
+            elif q_leq_p and not p_leq_q:
+                dominates[q, p] = True
+                n_dominators[p] += 1
+
+    ranks = np.full(n_trials, -1, dtype=np.int64)
+    rank = 0
+    n_sorted = 0
+    while n_sorted < n_below:
+        front = np.where((n_dominators == 0) & (ranks == -1))[0]
+        if len(front) == 0:
+            break
+        for p in front:
+            ranks[p] = rank
+            for q in range(n_trials):
+                if dominates[p, q]:
+                    n_dominators[q] -= 1
+        n_sorted += len(front)
+        rank += 1
+
+    # Trials worse than the top n_below ones are lumped into the worst rank.
+    for p in range(n_trials):
+        if ranks[p] == -1:
+            ranks[p] = rank
+    return ranks
+
+
+if _imports.is_successful():
+    _non_domination_rank_kernel = numba.njit(cache=True)(_non_domination_rank_kernel)
+
+
+def _non_domination_rank(loss_values: np.ndarray, *, n_below: int | None = None) -> np.ndarray:
+    """Calculate non-domination rank with the Numba-compiled kernel.
+
+    The result is equivalent to ``_fast_non_domination_rank`` without penalty up to the
+    top-``n_below`` trials; trials beyond ``n_below`` are all assigned the worst rank.
+    ``loss_values`` must not contain NaN.
+    """
+    assert _imports.is_successful()
+    n_below = min(n_below or len(loss_values), len(loss_values))
+    loss_values = np.ascontiguousarray(loss_values, dtype=np.float64)
+    return _non_domination_rank_kernel(loss_values, n_below)
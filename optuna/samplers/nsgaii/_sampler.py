@@ -5,8 +5,13 @@ from collections.abc import Sequence
 from typing import Any
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from optuna._experimental import warn_experimental_argument
+from optuna._transform import _SearchSpaceTransform
 from optuna.distributions import BaseDistribution
+from optuna.distributions import CategoricalDistribution
+from optuna.samplers._base import BaseSampler
 from optuna.samplers._ga import BaseGASampler
 from optuna.samplers._lazy_random_state import LazyRandomState
 from optuna.samplers._random import RandomSampler
@@ -26,6 +31,17 @@ if TYPE_CHECKING:
     from optuna.study import Study
 
 
+# The number of uniform variates drawn at once for the independent sampling of each trial.
+_UNIFORM_PREFETCH_SIZE = 64
+
+# The states with which trials can be told to the sampler.
+_VALID_STATES = frozenset((TrialState.COMPLETE, TrialState.FAIL, TrialState.PRUNED))
+
+# The maximum number of entries kept in the search space transform cache. Distributions with
+# trial-dependent value ranges produce unbounded distinct cache keys otherwise.
+_TRANSFORM_CACHE_MAX_SIZE = 256
+
+
 class NSGAIISampler(BaseGASampler):
     """Multi-objective sampler using the NSGA-II algorithm.
 
@@ -208,10 +224,14 @@ class NSGAIISampler(BaseGASampler):
             )
 
         super().__init__(population_size=population_size)
+        self._parent_population_cache: dict[tuple[int, int], list[FrozenTrial]] = {}
         self._random_sampler = RandomSampler(seed=seed)
         self._rng = LazyRandomState(seed)
         self._constraints_func = constraints_func
         self._search_space = IntersectionSearchSpace()
+        self._search_space_cache: tuple[tuple[int, int], dict[str, BaseDistribution]] | None = None
+        self._transform_cache: dict[tuple[str, BaseDistribution], _SearchSpaceTransform] = {}
+        self._prefetched_uniforms: dict[int, tuple[np.ndarray, int]] = {}
 
         self._elite_population_selection_strategy = (
             elite_population_selection_strategy
@@ -241,24 +261,55 @@ class NSGAIISampler(BaseGASampler):
     def infer_relative_search_space(
         self, study: Study, trial: FrozenTrial
     ) -> dict[str, BaseDistribution]:
-        search_space: dict[str, BaseDistribution] = {}
-        for name, distribution in self._search_space.calculate(study).items():
-            if distribution.single():
-                # The `untransform` method of `optuna._transform._SearchSpaceTransform`
-                # does not assume a single value,
-                # so single value objects are not sampled with the `sample_relative` method,
-                # but with the `sample_independent` method.
-                continue
-            search_space[name] = distribution
-        return search_space
+        # The intersection search space depends only on the completed trials, so the result is
+        # reused until a new trial completes instead of recalculating it for every trial.
+        cache_key = (
+            study._study_id,
+            study._storage.get_n_trials(study._study_id, TrialState.COMPLETE),
+        )
+        if self._search_space_cache is not None and self._search_space_cache[0] == cache_key:
+            return dict(self._search_space_cache[1])
+
+        # The `untransform` method of `optuna._transform._SearchSpaceTransform`
+        # does not assume a single value,
+        # so single value objects are not sampled with the `sample_relative` method,
+        # but with the `sample_independent` method.
+        search_space = {
+            name: distribution
+            for name, distribution in self._search_space.calculate(study).items()
+            if not distribution.single()
+        }
+        self._search_space_cache = (cache_key, search_space)
+        return dict(search_space)
 
     def select_parent(self, study: Study, generation: int) -> list[FrozenTrial]:
         return self._elite_population_selection_strategy(
             study,
-            self.get_population(study, generation - 1)
-            + self.get_parent_population(study, generation - 1),
+            [
+                *self.get_population(study, generation - 1),
+                *self.get_parent_population(study, generation - 1),
+            ],
         )
 
+    def get_parent_population(self, study: Study, generation: int) -> list[FrozenTrial]:
+        # The parent population of a generation is immutable once computed, so the resolved
+        # trials are memoized here to avoid a storage round-trip on every `sample_relative`
+        # call. The storage-side cache of `BaseGASampler` remains the source of truth shared
+        # among processes.
+        if generation == 0:
+            return []
+
+        cache_key = (study._study_id, generation)
+        parent_population = self._parent_population_cache.get(cache_key)
+        if parent_population is None:
+            parent_population = super().get_parent_population(study, generation)
+            self._parent_population_cache[cache_key] = parent_population
+            # Only the current and the previous generations can still be requested.
+            for key in list(self._parent_population_cache):
+                if key[0] == cache_key[0] and key[1] < generation - 1:
+                    del self._parent_population_cache[key]
+        return parent_population
+
     def sample_relative(
         self,
         study: Study,
@@ -282,13 +333,47 @@ class NSGAIISampler(BaseGASampler):
         # 1. A parameter in the initial population/first generation.
         # 2. A parameter to mutate.
         # 3. A parameter excluded from the intersection search space.
-
-        return self._random_sampler.sample_independent(
-            study, trial, param_name, param_distribution
-        )
+        #
+        # This is equivalent to `RandomSampler.sample_independent` but consumes a uniform
+        # variate pre-drawn in `before_trial` and reuses the search space transform per
+        # distribution, since this method is called once per parameter per trial and the
+        # per-call setup cost dominates for cheap objective functions.
+        uniform = self._next_prefetched_uniform(trial._trial_id)
+
+        if isinstance(param_distribution, CategoricalDistribution):
+            # The one-hot transform cannot be driven by a single scalar: filling every one-hot
+            # slot with the same value makes the `argmax` in `untransform` always pick the first
+            # choice. The uniform variate is mapped to a choice index directly instead.
+            choices = param_distribution.choices
+            return choices[min(int(uniform * len(choices)), len(choices) - 1)]
+
+        transform_key = (param_name, param_distribution)
+        trans = self._transform_cache.get(transform_key)
+        if trans is None:
+            trans = _SearchSpaceTransform({param_name: param_distribution})
+            if len(self._transform_cache) >= _TRANSFORM_CACHE_MAX_SIZE:
+                self._transform_cache.clear()
+            self._transform_cache[transform_key] = trans
+
+        bounds = trans.bounds
+        trans_params = bounds[:, 0] + uniform * (bounds[:, 1] - bounds[:, 0])
+        return trans.untransform(trans_params)[param_name]
+
+    def _next_prefetched_uniform(self, trial_id: int) -> float:
+        entry = self._prefetched_uniforms.get(trial_id)
+        if entry is None or entry[1] >= len(entry[0]):
+            # Grow on demand, e.g. when the trial has more parameters than one batch covers.
+            entry = (self._rng.rng.random_sample(_UNIFORM_PREFETCH_SIZE), 0)
+        buf, cursor = entry
+        self._prefetched_uniforms[trial_id] = (buf, cursor + 1)
+        return float(buf[cursor])
 
     def before_trial(self, study: Study, trial: FrozenTrial) -> None:
         self._random_sampler.before_trial(study, trial)
+        self._prefetched_uniforms[trial._trial_id] = (
+            self._rng.rng.random_sample(_UNIFORM_PREFETCH_SIZE),
+            0,
+        )
 
     def after_trial(
         self,
@@ -297,6 +382,17 @@ class NSGAIISampler(BaseGASampler):
         state: TrialState,
         values: Sequence[float] | None,
     ) -> None:
-        assert state in [TrialState.COMPLETE, TrialState.FAIL, TrialState.PRUNED]
+        assert state in _VALID_STATES
+        self._prefetched_uniforms.pop(trial._trial_id, None)
+        # NOTE: The `constraints_func` evaluation inside `self._after_trial_strategy` cannot be
+        # deferred to a worker pool. Its result is written to the trial system attributes, and
+        # storages only accept that write while the trial is still running, i.e. within this
+        # method call (deferring it fails with `UpdateFinishedTrialError`). Concurrent
+        # constraint evaluation is instead obtained by running `Study.optimize` with
+        # `n_jobs > 1`, which invokes this method from multiple threads.
         self._after_trial_strategy(study, trial, state, values)
-        self._random_sampler.after_trial(study, trial, state, values)
+        # `RandomSampler` inherits `after_trial` from `BaseSampler` as a no-op, so the delegated
+        # call is skipped unless the method has been overridden or replaced on the instance.
+        random_sampler_after_trial = self._random_sampler.after_trial
+        if getattr(random_sampler_after_trial, "__func__", None) is not BaseSampler.after_trial:
+            random_sampler_after_trial(study, trial, state, values)
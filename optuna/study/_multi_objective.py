@@ -96,21 +96,23 @@ def _fast_non_domination_rank(
 
     ranks = np.full(len(loss_values), -1, dtype=int)
     is_penalty_nan = np.isnan(penalty)
-    is_feasible = np.logical_and(~is_penalty_nan, penalty <= 0)
     is_infeasible = np.logical_and(~is_penalty_nan, penalty > 0)
 
-    # First, we calculate the domination rank for feasible trials.
-    ranks[is_feasible] = _calculate_nondomination_rank(loss_values[is_feasible], n_below=n_below)
-    n_below -= np.count_nonzero(is_feasible)
-
-    # Second, we calculate the domination rank for infeasible trials.
-    top_rank_infeasible = np.max(ranks[is_feasible], initial=-1) + 1
-    ranks[is_infeasible] = top_rank_infeasible + _calculate_nondomination_rank(
-        penalty[is_infeasible][:, np.newaxis], n_below=n_below
+    # First, we calculate the domination rank for feasible and infeasible trials in a single
+    # pass. The constrained domination rules collapse into an unconstrained sort of augmented
+    # vectors: a feasible trial becomes ``[0, *loss_values]`` and an infeasible trial becomes
+    # ``[penalty, *inf]``. Every feasible trial then dominates every infeasible one via the
+    # leading column, infeasible trials compare by penalty only, and feasible trials compare
+    # by their objective values, without any branching per pair.
+    augmented_loss_values = np.empty((len(loss_values), loss_values.shape[1] + 1))
+    augmented_loss_values[:, 0] = np.where(is_infeasible, penalty, 0.0)
+    augmented_loss_values[:, 1:] = np.where(is_infeasible[:, np.newaxis], np.inf, loss_values)
+    ranks[~is_penalty_nan] = _calculate_nondomination_rank(
+        augmented_loss_values[~is_penalty_nan], n_below=n_below
     )
-    n_below -= np.count_nonzero(is_infeasible)
+    n_below -= np.count_nonzero(~is_penalty_nan)
 
-    # Third, we calculate the domination rank for trials with no penalty information.
+    # Second, we calculate the domination rank for trials with no penalty information.
     top_rank_penalty_nan = np.max(ranks[~is_penalty_nan], initial=-1) + 1
     ranks[is_penalty_nan] = top_rank_penalty_nan + _calculate_nondomination_rank(
         loss_values[is_penalty_nan], n_below=n_below
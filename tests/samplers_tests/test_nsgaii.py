@@ -23,6 +23,7 @@ from optuna.samplers import BaseSampler
 from optuna.samplers import NSGAIISampler
 from optuna.samplers._base import _CONSTRAINTS_KEY
 from optuna.samplers._lazy_random_state import LazyRandomState
+from optuna.samplers.nsgaii import _nds_numba
 from optuna.samplers.nsgaii import BaseCrossover
 from optuna.samplers.nsgaii import BLXAlphaCrossover
 from optuna.samplers.nsgaii import SBXCrossover
@@ -41,6 +42,7 @@ from optuna.samplers.nsgaii._elite_population_selection_strategy import (
 from optuna.samplers.nsgaii._elite_population_selection_strategy import _calc_crowding_distance
 from optuna.samplers.nsgaii._elite_population_selection_strategy import _crowding_distance_sort
 from optuna.samplers.nsgaii._elite_population_selection_strategy import _rank_population
+from optuna.study._multi_objective import _calculate_nondomination_rank
 from optuna.study._multi_objective import _dominates
 from optuna.study._study_direction import StudyDirection
 from optuna.testing.trials import _create_frozen_trial
@@ -148,6 +150,22 @@ def test_crossover_casting(choices: list[Any]) -> None:
     study.optimize(objective, n_trials=population_size * 2)
 
 
+def test_sample_independent_categorical_covers_all_choices() -> None:
+    choices = ["a", "b", "c"]
+
+    def objective(trial: optuna.Trial) -> Sequence[float]:
+        index = choices.index(trial.suggest_categorical("cat", choices))
+        return float(index), -float(index)
+
+    # All the trials belong to the initial population, so every parameter is sampled with
+    # `sample_independent`.
+    sampler = NSGAIISampler(population_size=50, seed=1)
+    study = optuna.create_study(directions=["minimize"] * 2, sampler=sampler)
+    study.optimize(objective, n_trials=40)
+
+    assert {t.params["cat"] for t in study.trials} == set(choices)
+
+
 def test_constraints_func_none() -> None:
     n_trials = 4
     n_objectives = 2
@@ -477,6 +495,32 @@ def test_rank_population_empty(n_dims: int) -> None:
         assert population_per_rank == []
 
 
+@pytest.mark.skipif(not _nds_numba._is_available(), reason="Failed to import Numba.")
+@pytest.mark.parametrize("n_objectives", [2, 3])
+@pytest.mark.parametrize("n_below", [None, 1, 7, 16, 64])
+def test_non_domination_rank_numba_parity(n_objectives: int, n_below: int | None) -> None:
+    n_trials = 16
+    rng = np.random.RandomState(0)
+    for _ in range(20):
+        # Integer values from a narrow range produce duplicated rows, and infinities are
+        # injected so that all the special cases rank identically in both implementations.
+        loss_values = rng.randint(-3, 4, size=(n_trials, n_objectives)).astype(float)
+        loss_values[rng.rand(n_trials) < 0.1] = np.inf
+        loss_values[rng.rand(n_trials) < 0.1] = -np.inf
+
+        ranks = _nds_numba._non_domination_rank(loss_values, n_below=n_below)
+        full_ranks = _calculate_nondomination_rank(loss_values)
+
+        # The ranks are guaranteed only up to the top-n_below trials: the fronts up to the one
+        # containing the n_below-th trial must match exactly, and all the remaining trials must
+        # be lumped into the next rank.
+        cumulative_counts = np.cumsum(np.bincount(full_ranks))
+        cutoff_rank = int(np.searchsorted(cumulative_counts, min(n_below or n_trials, n_trials)))
+        is_sorted = full_ranks <= cutoff_rank
+        assert np.array_equal(ranks[is_sorted], full_ranks[is_sorted])
+        assert np.all(ranks[~is_sorted] == cutoff_rank + 1)
+
+
 @pytest.mark.parametrize(
     "values, expected_dist",
     [